@@ -1,41 +1,61 @@
-from pathlib import Path
-
-import joblib
-import pandas as pd
 import streamlit as st
 
-from preprocessing import clean_resume
+from model_registry import get_registry
+from predict_cli import (
+    load_role_database,
+    role_index_info,
+    run_tier,
+    screen_resume,
+    should_run_tier,
+)
 
 try:
-    from skill_extractor import extract_skills
+    from skill_extractor import extract_skills, skill_index_info
     from embedding_matcher import enrich_skills, get_top_skills
     SKILLS_AVAILABLE = True
 except ImportError:
     SKILLS_AVAILABLE = False
 
 
-BASE_DIR = Path(__file__).parent
-MODEL_PATH = BASE_DIR / "models" / "resume_classifier.joblib"
-ROLE_DB_PATH = BASE_DIR / "data" / "role_database.csv"
+def load_model():
+    try:
+        return get_registry().get_model()
+    except FileNotFoundError as e:
+        raise RuntimeError(str(e))
 
 
-@st.cache_resource
-def load_model():
-    if not MODEL_PATH.exists():
-        raise RuntimeError(
-            f"Model file not found at {MODEL_PATH}. Run 'python train.py' first."
-        )
-    return joblib.load(MODEL_PATH)
+def extract_and_enrich(text: str):
+    extracted = extract_skills(text)
+    return extracted, enrich_skills(extracted)
 
 
-@st.cache_data
-def load_role_database():
-    if not ROLE_DB_PATH.exists():
-        return None
-    return pd.read_csv(ROLE_DB_PATH)
+def show_index_versions():
+    """Show which model, skills and role database versions this process is serving."""
+    indexes = {"Roles": role_index_info()}
+    try:
+        model_info = get_registry().info()
+        indexes["Model"] = {"version": model_info["version"], "rebuild_seconds": model_info["load_seconds"]}
+    except FileNotFoundError:
+        pass
+    if SKILLS_AVAILABLE:
+        indexes["Skills"] = skill_index_info()
+    with st.sidebar:
+        st.caption("Loaded indexes")
+        for name, info in indexes.items():
+            st.caption(f"{name}: `{info['version']}` (built in {info['rebuild_seconds'] * 1000:.0f} ms)")
 
 
 st.title("Resume Screening App")
+show_index_versions()
+with st.sidebar:
+    fast_mode = st.checkbox(
+        "Fast mode", value=False,
+        help="Skip the classifier and skill extraction when the keyword match is decisive",
+    )
+    budget_ms = st.number_input(
+        "Latency budget (ms)", min_value=0, value=0, step=50, disabled=not fast_mode,
+        help="In fast mode, still run slower stages that fit in this budget",
+    ) or None
 st.write("Paste a resume below to get the top 3 recommended positions with detailed information.")
 
 resume_text = st.text_area("Resume text", height=300, placeholder="Paste your resume here...")
@@ -44,39 +64,28 @@ if st.button("Analyze Resume & Get Recommendations"):
     if not resume_text.strip():
         st.warning("Please paste a resume first.")
     else:
-        model = load_model()
         role_db = load_role_database()
-        cleaned = clean_resume(resume_text)
-        pred = model.predict([cleaned])[0]
+        result = screen_resume(
+            resume_text, load_model, role_db, top=3, fast=fast_mode, budget_ms=budget_ms
+        )
+        pred = result["prediction"]
+        top_matches = result["top_matches"]
         
         extracted_skills = None
         enriched_skills = None
-        if SKILLS_AVAILABLE:
+        if SKILLS_AVAILABLE and should_run_tier(result, "skills", fast_mode, budget_ms):
             with st.spinner("🔍 Extracting skills..."):
                 try:
-                    extracted_skills = extract_skills(resume_text)
-                    enriched_skills = enrich_skills(extracted_skills)
+                    extracted_skills, enriched_skills = run_tier(
+                        result, "skills", lambda: extract_and_enrich(resume_text)
+                    )
                 except Exception as e:
                     st.warning(f"Skill extraction unavailable: {e}")
         
-        text_low = cleaned.lower()
-        
-        top_matches = []
+        timings = ", ".join(f"{tier} {ms:.0f} ms" for tier, ms in result["timings_ms"].items())
+        st.caption(f"Decided by: {result['decided_by']} ({timings})")
         
         if role_db is not None:
-            # Calculate match score for each role
-            role_scores = {}
-            for idx, row in role_db.iterrows():
-                keywords = [k.strip() for k in row['keywords'].split(',')]
-                score = sum(1 for k in keywords if k in text_low)
-                if score > 0:
-                    role_scores[row['role_name']] = score
-            
-            # Get top 3 matches
-            if role_scores:
-                sorted_roles = sorted(role_scores.items(), key=lambda x: x[1], reverse=True)
-                top_matches = sorted_roles[:3]
-            
             # Display top 3 recommendations
             if top_matches:
                 st.success(f"✅ Analysis Complete! Here are your top {len(top_matches)} recommended positions:")
@@ -0,0 +1,167 @@
+"""Benchmark accuracy versus latency of each screening tier on the labeled dataset.
+
+Runs every resume in ``data/resume_dataset.csv`` through:
+
+- keywords:   role keyword scoring only (best role, if any)
+- classifier: the trained model only
+- full:       keywords + classifier + skill extraction, as the app does by default
+- fast:       the cascade, with an optional ``--budget-ms``
+
+and reports accuracy against the dataset labels, the share of predictions
+with no counterpart among those labels, agreement with the full pipeline,
+latency and how often the cheap tier decided the result. Role names are
+mapped to dataset categories through ``ROLE_TO_CATEGORY``. The classifier
+was trained on this dataset, so its accuracy here is optimistic.
+
+Usage:
+    python cascade_bench.py [--budget-ms 50] [--limit 500]
+"""
+import argparse
+import statistics
+import time
+
+from data_loader import load_csv_data
+from predict_cli import (
+    load_model,
+    load_role_database,
+    run_tier,
+    score_roles,
+    screen_resume,
+    should_run_tier,
+)
+from preprocessing import clean_resume
+from train import DATA_PATH
+
+# Roles from role_database.csv that correspond to a resume_dataset.csv category.
+# Keyword-tier predictions are role names, so they are mapped before scoring;
+# roles without a counterpart (e.g. "Backend Developer") count as wrong.
+ROLE_TO_CATEGORY = {
+    "Data Scientist": "Data Science",
+    "Machine Learning Engineer": "Data Science",
+    "AI Engineer": "Data Science",
+    "NLP Engineer": "Data Science",
+    "Computer Vision Engineer": "Data Science",
+    "DevOps Engineer": "DevOps Engineer",
+    "Site Reliability Engineer": "DevOps Engineer",
+    "Release Manager": "DevOps Engineer",
+    "Database Administrator": "Database",
+    "QA Engineer": "Testing",
+    "Test Engineer": "Testing",
+    "Blockchain Developer": "Blockchain",
+    "Business Analyst": "Business Analyst",
+    "Network Security Engineer": "Network Security Engineer",
+    "Security Engineer": "Network Security Engineer",
+    "Information Security Analyst": "Network Security Engineer",
+    "Penetration Tester": "Network Security Engineer",
+    "Frontend Developer": "Web Designing",
+    "UI/UX Designer": "Web Designing",
+    "Graphic Designer": "Arts",
+    "Mechanical Engineer": "Mechanical Engineer",
+    "Civil Engineer": "Civil Engineer",
+    "Electrical Engineer": "Electrical Engineering",
+    "Operations Manager": "Operations Manager",
+    "Human Resources Manager": "HR",
+    "Recruiter": "HR",
+    "HR Business Partner": "HR",
+    "Compensation and Benefits Analyst": "HR",
+    "Training and Development Manager": "HR",
+    "Sales Manager": "Sales",
+    "Account Executive": "Sales",
+    "Inside Sales Representative": "Sales",
+    "Business Development Manager": "Sales",
+    "Sales Engineer": "Sales",
+    "IT Project Manager": "PMO",
+    "Scrum Master": "PMO",
+}
+
+try:
+    from skill_extractor import extract_skills
+    from embedding_matcher import enrich_skills
+    SKILLS_AVAILABLE = True
+except ImportError:
+    SKILLS_AVAILABLE = False
+
+
+def _screen_with_skills(text, model, role_db, fast, budget_ms):
+    result = screen_resume(text, model, role_db, fast=fast, budget_ms=budget_ms)
+    if SKILLS_AVAILABLE and should_run_tier(result, "skills", fast, budget_ms):
+        run_tier(result, "skills", lambda: enrich_skills(extract_skills(text)))
+    return result
+
+
+def to_category(prediction, categories):
+    """Map a prediction onto the dataset's label space, or None if it has no counterpart."""
+    if prediction in categories:
+        return prediction
+    return ROLE_TO_CATEGORY.get(prediction)
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Accuracy vs latency of each screening tier.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Latency budget for the fast cascade")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N resumes")
+    args = parser.parse_args(argv)
+
+    df = load_csv_data(DATA_PATH)
+    if args.limit:
+        df = df.head(args.limit)
+    texts = df["text"].astype(str).tolist()
+    labels = df["category"].tolist()
+
+    model = load_model()
+    role_db = load_role_database()
+
+    def keywords_only(text):
+        scores = score_roles(clean_resume(text), role_db)
+        return {"prediction": scores[0][0] if scores else None, "decided_by": "keywords"}
+
+    def classifier_only(text):
+        return {"prediction": model.predict([clean_resume(text)])[0], "decided_by": "classifier"}
+
+    modes = {
+        "keywords": keywords_only,
+        "classifier": classifier_only,
+        "full": lambda text: _screen_with_skills(text, model, role_db, False, None),
+        "fast": lambda text: _screen_with_skills(text, model, role_db, True, args.budget_ms),
+    }
+
+    runs = {}
+    for name, screen in modes.items():
+        screen(texts[0])  # warm up caches and lazy imports
+        predictions, latencies, cheap = [], [], 0
+        for text in texts:
+            start = time.perf_counter()
+            result = screen(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+            predictions.append(result["prediction"])
+            cheap += result["decided_by"] == "keywords"
+        runs[name] = (predictions, latencies, cheap)
+
+    categories = set(labels)
+    runs = {
+        name: ([to_category(p, categories) for p in predictions], latencies, cheap)
+        for name, (predictions, latencies, cheap) in runs.items()
+    }
+    full_predictions = runs["full"][0]
+    print(f"{len(texts)} labeled resumes, skills tier {'on' if SKILLS_AVAILABLE else 'unavailable'}"
+          + (f", fast budget {args.budget_ms:.0f} ms" if args.budget_ms is not None else ""))
+    print(f"{'mode':<12} {'accuracy':>9} {'agree/full':>11} {'unmapped':>9} "
+          f"{'mean ms':>9} {'p95 ms':>8} {'keyword-decided':>16}")
+    for name, (predictions, latencies, cheap) in runs.items():
+        accuracy = sum(p == y for p, y in zip(predictions, labels)) / len(labels)
+        agreement = sum(p == f for p, f in zip(predictions, full_predictions)) / len(labels)
+        unmapped = sum(p is None for p in predictions) / len(labels)
+        print(
+            f"{name:<12} {accuracy:>9.1%} {agreement:>11.1%} {unmapped:>9.1%} "
+            f"{statistics.mean(latencies):>9.2f} {_percentile(latencies, 95):>8.2f} "
+            f"{cheap / len(labels):>16.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
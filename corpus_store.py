@@ -0,0 +1,149 @@
+"""Columnar, compressed storage for the resume corpus.
+
+Converts ``data/resume_dataset.csv`` into a Parquet file holding the raw
+text, cleaned text, category, years of experience and experience level, so
+loaders can read just the columns they need instead of parsing and cleaning
+the full CSV on every run.
+
+Usage:
+    python corpus_store.py convert
+    python corpus_store.py bench --scales 10 100
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from data_loader import categorize_experience_level, extract_years_experience, load_csv_data
+from preprocessing import clean_resume
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+BASE_DIR = Path(__file__).parent
+CSV_PATH = BASE_DIR / "data" / "resume_dataset.csv"
+CORPUS_PATH = BASE_DIR / "data" / "resume_dataset.parquet"
+CORPUS_COLUMNS = ["text", "cleaned_text", "category", "years_experience", "experience_level"]
+CATEGORICAL_COLUMNS = ["category", "experience_level"]
+
+
+def build_corpus_frame(csv_path: Path = CSV_PATH) -> pd.DataFrame:
+    """Parse and preprocess the CSV corpus into the stored column layout."""
+    df = load_csv_data(csv_path)
+    df["cleaned_text"] = df["text"].apply(clean_resume)
+    df["years_experience"] = df["text"].apply(extract_years_experience).astype("int16")
+    df["experience_level"] = df["years_experience"].apply(categorize_experience_level)
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype("category")
+    return df[CORPUS_COLUMNS]
+
+
+def write_corpus(df: pd.DataFrame, out_path: Path = CORPUS_PATH, compression: str = "zstd") -> None:
+    """Write a corpus frame to Parquet with dictionary-encoded label columns."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for the columnar corpus: pip install pyarrow")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, out_path, compression=compression, use_dictionary=CATEGORICAL_COLUMNS)
+
+
+def corpus_available(path: Path = CORPUS_PATH, source: Path = CSV_PATH) -> bool:
+    """Return True if a Parquet corpus exists, is readable and not older than its CSV."""
+    if not PYARROW_AVAILABLE or not path.exists():
+        return False
+    return not source.exists() or path.stat().st_mtime >= source.stat().st_mtime
+
+
+def load_corpus(columns: Optional[List[str]] = None, path: Path = CORPUS_PATH) -> pd.DataFrame:
+    """Load only the requested corpus columns, e.g. ``["cleaned_text", "category"]``.
+
+    Columns keep their Arrow types (strings are not converted to Python
+    objects), so callers that need NumPy arrays should use ``to_numpy()``.
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for the columnar corpus: pip install pyarrow")
+    return pd.read_parquet(path, columns=columns, engine="pyarrow", dtype_backend="pyarrow")
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def benchmark(scales: List[int], csv_path: Path = CSV_PATH) -> None:
+    """Compare CSV parsing against column-selective Parquet reads at scaled corpus sizes.
+
+    The CSV path mirrors ``train.load_data`` (parse, then clean every resume);
+    the Parquet path reads just the ``cleaned_text`` and ``category`` columns.
+    """
+    base = build_corpus_frame(csv_path)
+    print(f"Base corpus: {len(base)} resumes")
+    print(f"{'scale':>6} {'rows':>8} {'format':>8} {'file MB':>8} {'load s':>8} {'memory MB':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            scaled = pd.concat([base] * scale, ignore_index=True)
+            csv_file = Path(tmp) / f"corpus_{scale}.csv"
+            parquet_file = Path(tmp) / f"corpus_{scale}.parquet"
+            scaled[["category", "text"]].rename(
+                columns={"category": "Category", "text": "Resume"}
+            ).to_csv(csv_file, index=False)
+            write_corpus(scaled, parquet_file)
+            del scaled
+
+            def load_from_csv():
+                df = pd.read_csv(csv_file, encoding="utf-8")
+                df["cleaned_resume"] = df["Resume"].apply(clean_resume)
+                return df
+
+            runs = [
+                ("csv", csv_file, load_from_csv),
+                ("parquet", parquet_file, lambda: load_corpus(["cleaned_text", "category"], parquet_file)),
+            ]
+            for name, path, loader in runs:
+                df, seconds = _timed(loader)
+                memory = df.memory_usage(deep=True).sum()
+                print(
+                    f"{scale:>5}x {len(df):>8} {name:>8} {path.stat().st_size / 1e6:>8.1f} "
+                    f"{seconds:>8.2f} {memory / 1e6:>10.1f}"
+                )
+                del df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Columnar storage for the resume corpus.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_convert = sub.add_parser("convert", help="Convert the CSV corpus to compressed Parquet")
+    p_convert.add_argument("--csv", type=Path, default=CSV_PATH)
+    p_convert.add_argument("--out", type=Path, default=CORPUS_PATH)
+    p_convert.add_argument("--compression", default="zstd", help="Parquet codec (default: zstd)")
+
+    p_bench = sub.add_parser("bench", help="Compare load time and memory against CSV parsing")
+    p_bench.add_argument("--csv", type=Path, default=CSV_PATH)
+    p_bench.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+
+    args = parser.parse_args(argv)
+
+    if not PYARROW_AVAILABLE:
+        raise SystemExit("pyarrow is required for the columnar corpus: pip install pyarrow")
+
+    if args.command == "convert":
+        df = build_corpus_frame(args.csv)
+        write_corpus(df, args.out, args.compression)
+        print(f"Wrote {len(df)} resumes to {args.out} "
+              f"({args.csv.stat().st_size / 1e6:.1f} MB CSV -> {args.out.stat().st_size / 1e6:.1f} MB)")
+    elif args.command == "bench":
+        benchmark(args.scales, args.csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -94,18 +94,27 @@ def load_all_data() -> pd.DataFrame:
     """Load and combine data from all supported formats in the data/ directory."""
     all_data = []
     
-    # Load existing CSV if it exists at root
+    # Load the main dataset, preferring the columnar corpus when it is up to date
+    from corpus_store import corpus_available, load_corpus
+
     root_csv = BASE_DIR / "data" / "resume_dataset.csv"
-    if root_csv.exists():
+    if corpus_available(source=root_csv):
+        all_data.append(load_corpus())
+    elif root_csv.exists():
         df = load_csv_data(root_csv)
         all_data.append(df)
     
     if not DATA_DIR.exists():
         DATA_DIR.mkdir(exist_ok=True)
     
-    # Load CSV files from data/
+    # Load other CSV files from data/
     for csv_file in DATA_DIR.glob("*.csv"):
+        if csv_file == root_csv:
+            continue
         df = load_csv_data(csv_file)
+        # Skip non-resume tables such as role_database.csv
+        if "text" not in df.columns:
+            continue
         all_data.append(df)
     
     # Load JSON files from data/
@@ -129,10 +138,20 @@ def load_all_data() -> pd.DataFrame:
     if "text" not in combined.columns or "category" not in combined.columns:
         raise ValueError("Combined data must have 'text' and 'category' columns")
     
-    # Clean text and extract experience
-    combined["cleaned_text"] = combined["text"].apply(clean_resume)
-    combined["years_experience"] = combined["text"].apply(extract_years_experience)
-    combined["experience_level"] = combined["years_experience"].apply(categorize_experience_level)
+    # Clean text and extract experience for rows the corpus did not precompute
+    for column in ("cleaned_text", "years_experience", "experience_level"):
+        if column not in combined.columns:
+            combined[column] = None
+    missing = combined["cleaned_text"].isna()
+    if missing.any():
+        # Arrow-typed corpus columns can't take new values in place
+        for column in ("cleaned_text", "years_experience", "experience_level"):
+            combined[column] = combined[column].astype(object)
+        texts = combined.loc[missing, "text"]
+        years = texts.apply(extract_years_experience)
+        combined.loc[missing, "cleaned_text"] = texts.apply(clean_resume)
+        combined.loc[missing, "years_experience"] = years
+        combined.loc[missing, "experience_level"] = years.apply(categorize_experience_level)
     
     return combined
 
@@ -147,7 +166,7 @@ def get_data_by_level(df: pd.DataFrame, level: str) -> Tuple[List[str], List[str
     if subset.empty:
         raise ValueError(f"No data found for experience level: {level}")
     
-    X = subset["cleaned_text"].values.tolist()
-    y = subset["category"].values.tolist()
+    X = subset["cleaned_text"].tolist()
+    y = subset["category"].tolist()
     
     return X, y
@@ -1,52 +1,49 @@
-import json
-from pathlib import Path
 from typing import Dict, List, Tuple
 from difflib import SequenceMatcher
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
-SKILLS_PATH = Path(__file__).parent / "skills.json"
-with open(SKILLS_PATH, "r", encoding="utf-8") as f:
-    SKILL_DICT = json.load(f)
+from skill_index import SKILL_INDEX, SkillIndex
+from skill_index import SKILLS_PATH  # noqa: F401  re-exported for compatibility
 
-CANONICAL_SKILLS = []
-SKILL_TO_CATEGORY = {}
-for category, skills in SKILL_DICT.items():
-    for skill in skills:
-        skill_lower = skill.lower()
-        CANONICAL_SKILLS.append(skill_lower)
-        SKILL_TO_CATEGORY[skill_lower] = category
+# Module-level names of the matcher structures, resolved against the current index
+_LEGACY_NAMES = {
+    "SKILL_DICT": "skill_dict",
+    "CANONICAL_SKILLS": "canonical_skills",
+    "SKILL_TO_CATEGORY": "all_skills",
+    "vectorizer": "vectorizer",
+    "SKILL_VECTORS": "skill_vectors",
+}
 
-vectorizer = TfidfVectorizer(
-    analyzer='char_wb',
-    ngram_range=(2, 4),
-    min_df=1,
-    lowercase=True
-)
 
-SKILL_VECTORS = vectorizer.fit_transform(CANONICAL_SKILLS)
+def __getattr__(name):
+    if name in _LEGACY_NAMES:
+        return getattr(SKILL_INDEX.current(), _LEGACY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def match_skill_to_canonical(skill: str, threshold: float = 0.5) -> Tuple[str, float]:
+def match_skill_to_canonical(skill: str, threshold: float = 0.5,
+                             index: SkillIndex = None) -> Tuple[str, float]:
+    if index is None:
+        index = SKILL_INDEX.current()
     skill_lower = skill.lower().strip()
     
-    if skill_lower in SKILL_TO_CATEGORY:
+    if skill_lower in index.all_skills:
         return skill_lower, 1.0
     
-    for canonical in CANONICAL_SKILLS:
+    for canonical in index.canonical_skills:
         if canonical in skill_lower or skill_lower in canonical:
             similarity = SequenceMatcher(None, skill_lower, canonical).ratio()
             if similarity >= threshold:
                 return canonical, similarity
     
     try:
-        skill_vector = vectorizer.transform([skill_lower])
-        similarities = cosine_similarity(skill_vector, SKILL_VECTORS)[0]
+        skill_vector = index.vectorizer.transform([skill_lower])
+        similarities = cosine_similarity(skill_vector, index.skill_vectors)[0]
         
         best_idx = int(np.argmax(similarities))
         best_score = float(similarities[best_idx])
-        best_match = CANONICAL_SKILLS[best_idx]
+        best_match = index.canonical_skills[best_idx]
         
         if best_score >= threshold:
             return best_match, best_score
@@ -68,31 +65,37 @@ def match_skills_batch(skills: List[str], threshold: float = 0.5) -> Dict[str, T
     Returns:
         Dictionary mapping original skill → (canonical_skill, confidence)
     """
+    # Use one index snapshot for the whole batch, even if a reload swaps it meanwhile
+    index = SKILL_INDEX.current()
     matches = {}
     for skill in skills:
-        canonical, confidence = match_skill_to_canonical(skill, threshold)
+        canonical, confidence = match_skill_to_canonical(skill, threshold, index)
         matches[skill] = (canonical, confidence)
     return matches
 
 
-def get_skill_category(skill: str) -> str:
+def get_skill_category(skill: str, index: SkillIndex = None) -> str:
+    if index is None:
+        index = SKILL_INDEX.current()
     skill_lower = skill.lower().strip()
-    return SKILL_TO_CATEGORY.get(skill_lower, "unknown")
+    return index.all_skills.get(skill_lower, "unknown")
 
 
 def enrich_skills(extracted_skills: dict, threshold: float = 0.5) -> dict:
+    # Use one index snapshot for the whole call, even if a reload swaps it meanwhile
+    index = SKILL_INDEX.current()
     enriched = {}
     
     for category, skills in extracted_skills.items():
         enriched[category] = []
         
         for skill in skills:
-            canonical, confidence = match_skill_to_canonical(skill, threshold)
+            canonical, confidence = match_skill_to_canonical(skill, threshold, index)
             enriched[category].append({
                 "original": skill,
                 "canonical": canonical,
                 "confidence": float(confidence),
-                "category": get_skill_category(canonical)
+                "category": get_skill_category(canonical, index)
             })
     
     return enriched
@@ -0,0 +1,131 @@
+"""Hot reloading of file-backed indexes for long-running processes.
+
+A ``ReloadableIndex`` builds an in-memory index from a file and rebuilds it
+in a background thread when the file changes. Readers call ``current()`` and
+keep using the snapshot they got back, so in-flight requests finish on the
+old index while the new one is swapped in with a single reference
+assignment.
+"""
+import hashlib
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def file_version(path: Path) -> str:
+    """Return a short content hash identifying the current version of a file."""
+    if not path.exists():
+        return "missing"
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+def _file_stamp(path: Path):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class ReloadableIndex:
+    """An index built from ``path`` that is rebuilt when the file changes.
+
+    Args:
+        path: File the index is built from.
+        builder: Callable taking the path and returning the index.
+        check_interval: Minimum seconds between file change checks.
+        on_swap: Optional callback invoked with each newly swapped-in index.
+    """
+
+    def __init__(self, path: Path, builder: Callable, check_interval: float = 2.0,
+                 on_swap: Optional[Callable] = None):
+        self.path = Path(path)
+        self.builder = builder
+        self.check_interval = check_interval
+        self.on_swap = on_swap
+        self.last_error = None
+
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._last_check = time.monotonic()
+        self._stamp = _file_stamp(self.path)
+        self._value, self.version, self.rebuild_seconds = self._build()
+        self.loaded_at = time.time()
+
+    def _build(self):
+        start = time.perf_counter()
+        version = file_version(self.path)
+        value = self.builder(self.path)
+        return value, version, time.perf_counter() - start
+
+    def current(self):
+        """Return the current index, starting a background rebuild if the file changed.
+
+        Never blocks on a rebuild: the previous index is returned until the
+        new one is ready.
+        """
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            self._maybe_rebuild()
+        return self._value
+
+    def _maybe_rebuild(self) -> None:
+        stamp = _file_stamp(self.path)
+        if stamp == self._stamp:
+            return
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._rebuild, args=(stamp,), daemon=True).start()
+
+    def _rebuild(self, stamp) -> None:
+        try:
+            version = file_version(self.path)
+            if version != self.version:
+                value, version, seconds = self._build()
+                # Swap in one assignment; readers holding the old index are unaffected
+                self._value = value
+                self.version = version
+                self.rebuild_seconds = seconds
+                self.loaded_at = time.time()
+                self.last_error = None
+                if self.on_swap is not None:
+                    self.on_swap(value)
+            self._stamp = stamp
+        except Exception as e:
+            # Keep serving the previous index; retry on the next change
+            self.last_error = f"{type(e).__name__}: {e}"
+            self._stamp = stamp
+            print(f"⚠️  Failed to reload {self.path.name}: {self.last_error}", file=sys.stderr)
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def reload(self) -> None:
+        """Rebuild the index synchronously, regardless of whether the file changed."""
+        value, version, seconds = self._build()
+        self._value = value
+        self.version = version
+        self.rebuild_seconds = seconds
+        self.loaded_at = time.time()
+        self._stamp = _file_stamp(self.path)
+        if self.on_swap is not None:
+            self.on_swap(value)
+
+    def info(self) -> dict:
+        """Return the version id, load time and last rebuild duration."""
+        return {
+            "path": str(self.path),
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "rebuild_seconds": self.rebuild_seconds,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,86 @@
+"""Process-wide registry for the trained resume classifier.
+
+The model is deserialized once per process and shared by the CLI, the app,
+job workers and ``train.predict_resume``. The registry watches the model
+file; when ``train.py`` writes a new one it is loaded and validated in the
+background and swapped in atomically, while requests already running keep
+the model they started with. A model that fails validation is ignored and
+the previous one stays in service.
+"""
+import threading
+from pathlib import Path
+from typing import Tuple
+
+import joblib
+import numpy as np
+
+from hot_reload import ReloadableIndex
+
+
+BASE_DIR = Path(__file__).parent
+MODEL_PATH = BASE_DIR / "models" / "resume_classifier.joblib"
+
+# Smoke-test input every candidate model must be able to score
+VALIDATION_TEXT = "Python developer with experience in SQL, machine learning and web applications"
+
+
+def load_validated_model(path: Path):
+    """Load a model file and check that it can score text before it is served."""
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Model file not found at {path}. Run 'python train.py' first."
+        )
+    model = joblib.load(path)
+
+    if not hasattr(model, "predict_proba") or not hasattr(model, "classes_"):
+        raise ValueError(f"{path.name} is not a fitted probabilistic classifier")
+    probabilities = model.predict_proba([VALIDATION_TEXT])
+    if probabilities.shape != (1, len(model.classes_)):
+        raise ValueError(f"{path.name} returned probabilities of shape {probabilities.shape}")
+    return model
+
+
+class ModelRegistry:
+    """Holds the current classifier and hot swaps it when the model file changes.
+
+    Args:
+        path: Model file written by ``train.py``.
+        check_interval: Minimum seconds between model file change checks.
+    """
+
+    def __init__(self, path: Path = MODEL_PATH, check_interval: float = 2.0):
+        self._index = ReloadableIndex(path, load_validated_model, check_interval)
+
+    def get_model(self):
+        """Return the model currently in service."""
+        return self._index.current()
+
+    def predict(self, cleaned_text: str) -> Tuple[str, np.ndarray]:
+        """Return the predicted category and class probabilities in one pass."""
+        model = self.get_model()
+        probabilities = model.predict_proba([cleaned_text])[0]
+        return model.classes_[int(np.argmax(probabilities))], probabilities
+
+    def info(self) -> dict:
+        """Return the model version id, load time and any rejected reload."""
+        info = self._index.info()
+        info["load_seconds"] = info.pop("rebuild_seconds")
+        return info
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    """Return the process-wide registry, loading the model on first use.
+
+    Raises:
+        FileNotFoundError: If no trained model exists yet.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
@@ -1,31 +1,146 @@
 import argparse
 import sys
+import time
 from pathlib import Path
 
-import joblib
 import pandas as pd
 
+from hot_reload import ReloadableIndex
+from model_registry import get_registry
 from preprocessing import clean_resume
+from result_cache import CACHE_PATH, ResultCache, screening_options
 
 
 BASE_DIR = Path(__file__).parent
-MODEL_PATH = BASE_DIR / "models" / "resume_classifier.joblib"
 ROLE_DB_PATH = BASE_DIR / "data" / "role_database.csv"
 
 
-def load_role_database():
-    """Load the role database with descriptions, certifications, and skills."""
-    if not ROLE_DB_PATH.exists():
+def _read_role_database(path: Path):
+    if not path.exists():
         return None
-    return pd.read_csv(ROLE_DB_PATH)
+    return pd.read_csv(path)
+
+
+ROLE_INDEX = None
+
+
+def load_role_database():
+    """Load the role database with descriptions, certifications, and skills.
+
+    The table is cached per process and reloaded in the background when the
+    CSV changes, so long-running callers should call this per request.
+    """
+    global ROLE_INDEX
+    if ROLE_INDEX is None:
+        ROLE_INDEX = ReloadableIndex(ROLE_DB_PATH, _read_role_database)
+    return ROLE_INDEX.current()
+
+
+def role_index_info() -> dict:
+    """Return the version id and rebuild time of the loaded role database."""
+    load_role_database()
+    return ROLE_INDEX.info()
 
 
 def load_model():
-    if not MODEL_PATH.exists():
-        raise SystemExit(
-            f"Model file not found at {MODEL_PATH}. Run 'python train.py' first."
-        )
-    return joblib.load(MODEL_PATH)
+    try:
+        return get_registry().get_model()
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
+
+
+def score_roles(cleaned_text: str, role_db) -> list:
+    """Score every role by how many of its keywords appear in the text.
+
+    Returns (role_name, score) pairs with a non-zero score, best first.
+    """
+    text_low = cleaned_text.lower()
+    role_scores = {}
+    for idx, row in role_db.iterrows():
+        keywords = [k.strip() for k in row['keywords'].split(',')]
+        score = sum(1 for k in keywords if k in text_low)
+        if score > 0:
+            role_scores[row['role_name']] = score
+    return sorted(role_scores.items(), key=lambda x: x[1], reverse=True)
+
+
+# Keyword score at which the best role match overrides the classifier
+STRONG_MATCH_SCORE = 3
+
+# Running estimates of per-tier latency, used to decide what fits a budget
+TIER_COST_MS = {"keywords": 5.0, "classifier": 20.0, "skills": 150.0}
+
+
+def should_run_tier(result: dict, tier: str, fast: bool = False, budget_ms: float = None) -> bool:
+    """Decide whether an expensive tier should run for a partially screened resume.
+
+    Outside fast mode every tier runs. In fast mode a tier runs when the
+    keyword tier was not decisive, or when the time left in ``budget_ms``
+    covers the tier's estimated cost.
+    """
+    if not fast or not result["decisive"]:
+        return True
+    if budget_ms is None:
+        return False
+    spent = sum(result["timings_ms"].values())
+    return budget_ms - spent >= TIER_COST_MS[tier]
+
+
+def run_tier(result: dict, tier: str, fn):
+    """Run one tier, recording its latency in the result and the cost estimates."""
+    start = time.perf_counter()
+    value = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    result["timings_ms"][tier] = elapsed_ms
+    result["tiers_run"].append(tier)
+    TIER_COST_MS[tier] = 0.8 * TIER_COST_MS[tier] + 0.2 * elapsed_ms
+    return value
+
+
+def screen_resume(raw_text: str, model, role_db=None, top: int = 3,
+                  fast: bool = False, budget_ms: float = None) -> dict:
+    """Screen a single resume and return the prediction and top role matches.
+
+    The classifier prediction is overridden by the best keyword match from
+    the role database when that match has strong evidence (score >= 3).
+    In fast mode the cheap keyword tier runs first and the classifier is
+    skipped when the best role clears that bar, unless ``budget_ms`` leaves
+    room for it. ``model`` may also be a zero-argument loader, so a skipped
+    classifier is never loaded.
+
+    The result reports which tier decided the prediction (``decided_by``),
+    the tiers that ran and their latencies.
+    """
+    result = {
+        "prediction": None,
+        "top_matches": [],
+        "decided_by": "classifier",
+        "decisive": False,
+        "tiers_run": [],
+        "timings_ms": {},
+    }
+    cleaned = clean_resume(raw_text)
+
+    if role_db is not None:
+        scores = run_tier(result, "keywords", lambda: score_roles(cleaned, role_db))
+        result["top_matches"] = scores[:top]
+        
+        # Use the best match as primary prediction if strong evidence. A tie
+        # at the top is decided by keyword order either way, so the
+        # classifier's output would be unused and fast mode can skip it.
+        if scores and scores[0][1] >= STRONG_MATCH_SCORE:
+            result["prediction"] = scores[0][0]
+            result["decided_by"] = "keywords"
+            result["decisive"] = True
+
+    if should_run_tier(result, "classifier", fast, budget_ms):
+        fitted = model if hasattr(model, "predict") else model()
+        pred = run_tier(result, "classifier", lambda: fitted.predict([cleaned])[0])
+        result["classifier_prediction"] = pred
+        if result["decided_by"] == "classifier":
+            result["prediction"] = pred
+
+    return result
 
 
 def main(argv=None):
@@ -50,6 +165,34 @@ def main(argv=None):
         default=3,
         help="Number of top matching roles to show (default: 3)",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip the classifier when the keyword match is decisive",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="With --fast, still run the classifier if it fits in this latency budget",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for previously screened resumes from an on-disk cache",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=CACHE_PATH,
+        help=f"Result cache file (default: {CACHE_PATH.name})",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=256,
+        help="Evict least recently used results above this size (default: 256)",
+    )
     args = parser.parse_args(argv)
 
     if args.text:
@@ -64,32 +207,22 @@ def main(argv=None):
     # Load role database
     role_db = load_role_database()
     
-    model = load_model()
-    cleaned = clean_resume(raw_text)
-    pred = model.predict([cleaned])[0]
-
-    # Match against role database using keywords
-    text_low = cleaned.lower()
+    model = load_model if args.fast or args.cache else load_model()
     
-    top_matches = []
+    def compute():
+        return screen_resume(
+            raw_text, model, role_db, top=args.top, fast=args.fast, budget_ms=args.budget_ms
+        )
     
-    if role_db is not None:
-        # Calculate match score for each role in database
-        role_scores = {}
-        for idx, row in role_db.iterrows():
-            keywords = [k.strip() for k in row['keywords'].split(',')]
-            score = sum(1 for k in keywords if k in text_low)
-            if score > 0:
-                role_scores[row['role_name']] = score
-        
-        # Get top N matches
-        if role_scores:
-            sorted_roles = sorted(role_scores.items(), key=lambda x: x[1], reverse=True)
-            top_matches = sorted_roles[:args.top]
-            
-            # Use the best match as primary prediction if strong evidence
-            if top_matches[0][1] >= 3:
-                pred = top_matches[0][0]
+    cache = None
+    if args.cache:
+        cache = ResultCache(args.cache_path, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+        options = screening_options(args.top, args.fast, args.budget_ms)
+        result = cache.get_or_compute(raw_text, options, compute)
+    else:
+        result = compute()
+    pred = result["prediction"]
+    top_matches = result["top_matches"]
     
     # Print results
     if args.verbose and role_db is not None and top_matches:
@@ -117,6 +250,16 @@ def main(argv=None):
     else:
         print(pred)
 
+    if args.verbose:
+        timings = ", ".join(f"{tier} {ms:.1f} ms" for tier, ms in result["timings_ms"].items())
+        cached = " [cached]" if result.get("cached") else ""
+        print(f"Decided by: {result['decided_by']} ({timings}){cached}")
+        if "classifier" in result["tiers_run"] and not result.get("cached"):
+            info = get_registry().info()
+            print(f"Model: {info['version']} (loaded in {info['load_seconds'] * 1000:.0f} ms)")
+        if cache is not None:
+            print(cache.summary())
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,201 @@
+"""Persistent on-disk cache of screening results.
+
+Results are keyed by a hash of the normalized resume text, the screening
+options and the versions of the model, skills and role database the process
+is serving.
+Entries written against other artifact versions are purged when the cache
+is opened, and the least recently used entries are evicted once the cache
+grows past its size limit.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from preprocessing import clean_resume
+
+
+BASE_DIR = Path(__file__).parent
+CACHE_PATH = BASE_DIR / "result_cache.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    artifacts TEXT NOT NULL,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def artifact_versions() -> dict:
+    """Return versions of the model, skills and role database currently in service.
+
+    These are the versions results are computed with. They can lag the files
+    on disk until a background reload has swapped the new version in.
+    """
+    from model_registry import get_registry
+    from predict_cli import role_index_info
+    from skill_index import SKILL_INDEX
+
+    try:
+        model_version = get_registry().info()["version"]
+    except FileNotFoundError:
+        model_version = "missing"
+    return {
+        "model": model_version,
+        "skills": SKILL_INDEX.version,
+        "roles": role_index_info()["version"],
+    }
+
+
+def screening_options(top: int = 3, fast: bool = False, budget_ms: float = None) -> dict:
+    """Return the screening options that go into a cache key.
+
+    The CLI and job workers both build their keys here, so their results
+    are shared. ``budget_ms`` only affects fast mode and is left out otherwise.
+    """
+    options = {"top": top, "fast": bool(fast)}
+    if fast:
+        options["budget_ms"] = budget_ms
+    return options
+
+
+def normalize_text(text: str) -> str:
+    """Normalize resume text so formatting-only differences share a cache entry."""
+    return clean_resume(text).lower()
+
+
+class ResultCache:
+    """SQLite-backed screening result cache with size-based LRU eviction.
+
+    Args:
+        path: Cache database file.
+        max_bytes: Total size of stored results above which old entries are evicted.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, max_bytes: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.artifacts = None
+        self.refresh_artifacts()
+
+    def refresh_artifacts(self) -> None:
+        """Re-read artifact versions, dropping entries computed against older ones."""
+        artifacts = json.dumps(artifact_versions(), sort_keys=True)
+        if artifacts != self.artifacts:
+            self.artifacts = artifacts
+            self.conn.execute("DELETE FROM entries WHERE artifacts != ?", (artifacts,))
+
+    def _key(self, text: str, options: dict) -> str:
+        payload = json.dumps([normalize_text(text), options, self.artifacts], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, name: str) -> None:
+        self.conn.execute(
+            "INSERT INTO stats (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, text: str, options: dict) -> Optional[dict]:
+        """Return the cached result for a resume, or None on a miss."""
+        key = self._key(text, options)
+        row = self.conn.execute("SELECT result FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            self._count("misses")
+            return None
+
+        self.hits += 1
+        self._count("hits")
+        self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, text: str, options: dict, result: dict) -> None:
+        """Store a result, evicting least recently used entries past the size limit."""
+        payload = json.dumps(result, default=str)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries (key, artifacts, result, size, last_access) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._key(text, options), self.artifacts, payload, len(payload), time.time()),
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Free down to 90% of the limit so eviction doesn't run on every insert
+        excess = total - int(self.max_bytes * 0.9)
+        stale = []
+        for key, size in self.conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def get_or_compute(self, text: str, options: dict, compute: Callable[[], dict]) -> dict:
+        """Return the cached result, computing and storing it on a miss.
+
+        The returned result has ``cached`` set to whether it came from the cache.
+        """
+        result = self.get(text, options)
+        if result is not None:
+            result["cached"] = True
+            return result
+        result = compute()
+        self.put(text, options, result)
+        result["cached"] = False
+        return result
+
+    def stats(self) -> dict:
+        """Return hit counts for this process and for the lifetime of the cache file."""
+        lifetime = dict(self.conn.execute("SELECT name, value FROM stats").fetchall())
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        hits, misses = lifetime.get("hits", 0), lifetime.get("misses", 0)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "lifetime_hits": hits,
+            "lifetime_misses": misses,
+            "lifetime_hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def summary(self, hits: int = None, misses: int = None) -> str:
+        """One-line description of cache usage for verbose output.
+
+        ``hits`` and ``misses`` override this process's lookup counts, e.g.
+        with the totals of a job run whose lookups happened in its workers.
+        """
+        stats = self.stats()
+        hits = stats["hits"] if hits is None else hits
+        misses = stats["misses"] if misses is None else misses
+        lookups = hits + misses
+        session = f"{hits}/{lookups} hits" if lookups else "no lookups"
+        return (
+            f"Cache: {session}; lifetime hit rate {stats['lifetime_hit_rate']:.1%} "
+            f"over {stats['lifetime_hits'] + stats['lifetime_misses']} lookups, "
+            f"{stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB"
+        )
+
+    def close(self) -> None:
+        self.conn.close()
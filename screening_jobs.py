@@ -0,0 +1,471 @@
+"""Resumable bulk screening backed by a local SQLite job queue.
+
+Resumes are submitted into a queue, claimed in batches by worker processes
+and screened with the same logic as ``predict_cli``. Every finished batch
+is committed in a single transaction, so an interrupted run loses at most
+the batches that were in flight and simply resumes on the next ``run``.
+
+Usage:
+    python screening_jobs.py submit applicants.csv
+    python screening_jobs.py run 1 --workers 8
+    python screening_jobs.py status 1
+    python screening_jobs.py export 1 results.csv
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import pandas as pd
+
+from data_loader import load_json_data
+from result_cache import CACHE_PATH, ResultCache, screening_options
+
+
+BASE_DIR = Path(__file__).parent
+DB_PATH = BASE_DIR / "screening_jobs.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    top INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    pid INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    cache_hits INTEGER NOT NULL DEFAULT 0,
+    cache_misses INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    source_ref TEXT NOT NULL,
+    text TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    run_id INTEGER REFERENCES runs(id),
+    worker TEXT,
+    claimed_at REAL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_items_job_status ON items(job_id, status);
+"""
+
+
+def connect(db_path: Path = DB_PATH) -> sqlite3.Connection:
+    """Open the job database, creating the schema if needed.
+
+    WAL mode lets the status command read while workers are writing.
+    """
+    conn = sqlite3.connect(str(db_path), timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# Accepted names for the resume text column of CSV/JSON applicant exports
+TEXT_COLUMNS = ("resume", "text", "resume_text")
+
+
+def read_resumes(path: Path) -> List[Tuple[str, str]]:
+    """Read (source_ref, text) pairs from a CSV, JSON, text file or directory.
+
+    CSV and JSON exports need a resume text column (see ``TEXT_COLUMNS``,
+    case-insensitive) but no label. Rows with an empty text cell are skipped.
+    """
+    if path.is_dir():
+        return [
+            (str(text_file.relative_to(path)), text_file.read_text(encoding="utf-8"))
+            for text_file in sorted(path.rglob("*.txt"))
+        ]
+
+    suffix = path.suffix.lower()
+    if suffix in (".csv", ".json"):
+        df = pd.read_csv(path, encoding="utf-8") if suffix == ".csv" else load_json_data(path)
+        columns = {str(column).lower(): column for column in df.columns}
+        text_column = next((columns[name] for name in TEXT_COLUMNS if name in columns), None)
+        if text_column is None:
+            raise ValueError(
+                f"{path} must contain a resume text column ({', '.join(TEXT_COLUMNS)})"
+            )
+        texts = df[text_column].dropna()
+        return [(f"{path.name}:{idx}", str(text)) for idx, text in texts.items()]
+
+    return [(path.name, path.read_text(encoding="utf-8"))]
+
+
+def submit_job(conn: sqlite3.Connection, resumes: Iterable[Tuple[str, str]],
+               source: str, top: int = 3) -> int:
+    """Create a job and enqueue its resumes in one transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        cur = conn.execute(
+            "INSERT INTO jobs (source, top, created_at) VALUES (?, ?, ?)",
+            (source, top, time.time()),
+        )
+        job_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO items (job_id, source_ref, text) VALUES (?, ?, ?)",
+            ((job_id, ref, text) for ref, text in resumes if text.strip()),
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return job_id
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def start_run(conn: sqlite3.Connection, job_id: int, pid: int = None) -> int:
+    """Register a new run of a job, closing out earlier runs whose process is gone."""
+    now = time.time()
+    for row in conn.execute(
+        "SELECT id, pid FROM runs WHERE job_id = ? AND finished_at IS NULL", (job_id,)
+    ).fetchall():
+        if not _pid_alive(row["pid"]):
+            conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (now, row["id"]))
+
+    cur = conn.execute(
+        "INSERT INTO runs (job_id, pid, started_at) VALUES (?, ?, ?)",
+        (job_id, pid or os.getpid(), now),
+    )
+    return cur.lastrowid
+
+
+def finish_run(conn: sqlite3.Connection, run_id: int) -> None:
+    conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (time.time(), run_id))
+
+
+def release_stale_claims(conn: sqlite3.Connection, job_id: int) -> int:
+    """Put items claimed by finished or interrupted runs back into the queue.
+
+    Claims held by runs that are still active, or by worker processes that
+    outlived their run, are left alone, so starting another run never
+    re-queues items that are still being screened.
+    """
+    workers = conn.execute(
+        "SELECT DISTINCT worker FROM items WHERE job_id = ? AND status = 'claimed' "
+        "AND (run_id IS NULL OR run_id IN (SELECT id FROM runs WHERE finished_at IS NOT NULL))",
+        (job_id,),
+    ).fetchall()
+    stale = [
+        (job_id, row["worker"]) for row in workers
+        if not (row["worker"] or "").startswith("pid-") or not _pid_alive(int(row["worker"][4:]))
+    ]
+    released = 0
+    for params in stale:
+        cur = conn.execute(
+            "UPDATE items SET status = 'pending', run_id = NULL, worker = NULL, claimed_at = NULL "
+            "WHERE job_id = ? AND status = 'claimed' AND worker IS ? "
+            "AND (run_id IS NULL OR run_id IN (SELECT id FROM runs WHERE finished_at IS NOT NULL))",
+            params,
+        )
+        released += cur.rowcount
+    return released
+
+
+def claim_batch(conn: sqlite3.Connection, job_id: int, worker: str,
+                batch_size: int, run_id: int = None) -> List[sqlite3.Row]:
+    """Atomically claim up to ``batch_size`` pending items for a worker of a run."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            "SELECT id, text FROM items WHERE job_id = ? AND status = 'pending' "
+            "ORDER BY id LIMIT ?",
+            (job_id, batch_size),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE items SET status = 'claimed', run_id = ?, worker = ?, claimed_at = ? "
+            "WHERE id = ?",
+            ((run_id, worker, time.time(), row["id"]) for row in rows),
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return rows
+
+
+def commit_results(conn: sqlite3.Connection, outcomes: List[Tuple[int, str, str]],
+                   run_id: int = None, cache_hits: int = 0, cache_misses: int = 0) -> None:
+    """Store a batch of (item_id, result_json, error) outcomes in one transaction.
+
+    The batch's result cache hits and misses are added to its run's totals.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "UPDATE items SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (
+                ("failed" if error else "done", result, error, now, item_id)
+                for item_id, result, error in outcomes
+            ),
+        )
+        if run_id is not None and cache_hits + cache_misses:
+            conn.execute(
+                "UPDATE runs SET cache_hits = cache_hits + ?, cache_misses = cache_misses + ? "
+                "WHERE id = ?",
+                (cache_hits, cache_misses, run_id),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _worker(db_path: str, job_id: int, run_id: int, batch_size: int,
+            cache_path: str = None) -> None:
+    """Claim and screen batches until the job has no pending items left."""
+    from predict_cli import load_model, load_role_database, screen_resume
+    worker = f"pid-{os.getpid()}"
+    conn = connect(Path(db_path))
+    cache = ResultCache(Path(cache_path)) if cache_path else None
+    top = conn.execute("SELECT top FROM jobs WHERE id = ?", (job_id,)).fetchone()["top"]
+
+    while True:
+        rows = claim_batch(conn, job_id, worker, batch_size, run_id)
+        if not rows:
+            break
+
+        # Read versions before loading, so a swap in between can only label
+        # results with an older version, whose entries the next refresh purges
+        if cache is not None:
+            cache.refresh_artifacts()
+            hits, misses = cache.hits, cache.misses
+        # Picks up retrained models and role database edits between batches
+        model = load_model()
+        role_db = load_role_database()
+        outcomes = []
+        for row in rows:
+            try:
+                if cache is not None:
+                    result = cache.get_or_compute(
+                        row["text"], screening_options(top),
+                        lambda: screen_resume(row["text"], model, role_db, top=top),
+                    )
+                else:
+                    result = screen_resume(row["text"], model, role_db, top=top)
+                payload = {
+                    "prediction": str(result["prediction"]),
+                    "top_matches": [[role, int(score)] for role, score in result["top_matches"]],
+                    "decided_by": result["decided_by"],
+                }
+                outcomes.append((row["id"], json.dumps(payload), None))
+            except Exception as e:
+                outcomes.append((row["id"], None, f"{type(e).__name__}: {e}"))
+        if cache is not None:
+            commit_results(conn, outcomes, run_id, cache.hits - hits, cache.misses - misses)
+        else:
+            commit_results(conn, outcomes)
+
+    if cache is not None:
+        cache.close()
+    conn.close()
+
+
+def run_job(job_id: int, workers: int = None, batch_size: int = 32,
+            db_path: Path = DB_PATH, cache_path: Path = None) -> None:
+    """Screen all pending items of a job using a pool of worker processes.
+
+    With ``cache_path`` set, workers share an on-disk result cache so
+    resumes screened before (in this or earlier jobs) are not recomputed.
+    """
+    conn = connect(db_path)
+    if conn.execute("SELECT 1 FROM jobs WHERE id = ?", (job_id,)).fetchone() is None:
+        raise SystemExit(f"Job {job_id} not found in {db_path}.")
+
+    run_id = start_run(conn, job_id)
+    released = release_stale_claims(conn, job_id)
+    if released:
+        print(f"Resuming job {job_id}: re-queued {released} interrupted items.", file=sys.stderr)
+
+    workers = workers or os.cpu_count() or 1
+    procs = [
+        multiprocessing.Process(
+            target=_worker,
+            args=(str(db_path), job_id, run_id, batch_size, str(cache_path) if cache_path else None),
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+    finally:
+        finish_run(conn, run_id)
+        conn.close()
+
+    failed = [proc.exitcode for proc in procs if proc.exitcode != 0]
+    if failed:
+        raise SystemExit(f"{len(failed)} worker(s) exited abnormally; run the job again to resume.")
+
+    if cache_path:
+        conn = connect(db_path)
+        run = conn.execute(
+            "SELECT cache_hits, cache_misses FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        conn.close()
+        cache = ResultCache(cache_path)
+        print(cache.summary(run["cache_hits"], run["cache_misses"]))
+        cache.close()
+
+
+def job_status(conn: sqlite3.Connection, job_id: int, now: float = None) -> dict:
+    """Summarize progress, throughput and ETA for a job.
+
+    Throughput and ETA are measured over the latest run only, so the time a
+    job spent interrupted before being resumed does not drag them down.
+    """
+    counts = {"pending": 0, "claimed": 0, "done": 0, "failed": 0}
+    for row in conn.execute(
+        "SELECT status, COUNT(*) AS n FROM items WHERE job_id = ? GROUP BY status", (job_id,)
+    ):
+        counts[row["status"]] = row["n"]
+
+    processed = counts["done"] + counts["failed"]
+    remaining = counts["pending"] + counts["claimed"]
+    throughput = None
+    eta_seconds = None
+
+    run = conn.execute(
+        "SELECT id, started_at, finished_at FROM runs WHERE job_id = ? ORDER BY id DESC LIMIT 1",
+        (job_id,),
+    ).fetchone()
+    if run is not None:
+        in_run = conn.execute(
+            "SELECT COUNT(*) AS n, MAX(finished_at) AS last FROM items "
+            "WHERE run_id = ? AND finished_at IS NOT NULL",
+            (run["id"],),
+        ).fetchone()
+        if run["finished_at"] is not None:
+            end = in_run["last"]
+        else:
+            end = now or time.time()
+        if in_run["n"] and end and end > run["started_at"]:
+            throughput = in_run["n"] / (end - run["started_at"])
+            eta_seconds = remaining / throughput
+
+    return {
+        "job_id": job_id,
+        "total": processed + remaining,
+        **counts,
+        "throughput_per_sec": throughput,
+        "eta_seconds": eta_seconds,
+    }
+
+
+def export_results(conn: sqlite3.Connection, job_id: int, out_path: Path) -> int:
+    """Write finished and failed items of a job to a CSV file."""
+    rows = conn.execute(
+        "SELECT id, source_ref, status, result, error FROM items "
+        "WHERE job_id = ? AND status IN ('done', 'failed') ORDER BY id",
+        (job_id,),
+    ).fetchall()
+
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "item_id", "source_ref", "status", "prediction", "decided_by", "top_matches", "error",
+        ])
+        for row in rows:
+            result = json.loads(row["result"]) if row["result"] else {}
+            matches = "; ".join(f"{role} ({score})" for role, score in result.get("top_matches", []))
+            writer.writerow([
+                row["id"], row["source_ref"], row["status"],
+                result.get("prediction", ""), result.get("decided_by", ""), matches,
+                row["error"] or "",
+            ])
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resumable bulk resume screening jobs.")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help=f"Job database (default: {DB_PATH.name})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_submit = sub.add_parser("submit", help="Queue resumes from a CSV/JSON file, text file or directory")
+    p_submit.add_argument("path", type=Path)
+    p_submit.add_argument("--top", "-t", type=int, default=3, help="Top matching roles to keep (default: 3)")
+
+    p_run = sub.add_parser("run", help="Screen pending items of a job (resumes interrupted jobs)")
+    p_run.add_argument("job_id", type=int)
+    p_run.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count)")
+    p_run.add_argument("--batch-size", "-b", type=int, default=32, help="Items per claimed batch (default: 32)")
+    p_run.add_argument("--cache", action="store_true", help="Reuse results from the on-disk result cache")
+
+    p_status = sub.add_parser("status", help="Show progress, throughput, ETA and failures")
+    p_status.add_argument("job_id", type=int)
+
+    p_export = sub.add_parser("export", help="Export screening results to CSV")
+    p_export.add_argument("job_id", type=int)
+    p_export.add_argument("out", type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        run_job(args.job_id, args.workers, args.batch_size, args.db, CACHE_PATH if args.cache else None)
+        args.command = "status"
+
+    conn = connect(args.db)
+
+    if args.command == "submit":
+        if not args.path.exists():
+            raise SystemExit(f"Input not found: {args.path}")
+        resumes = read_resumes(args.path)
+        job_id = submit_job(conn, resumes, str(args.path), args.top)
+        queued = conn.execute(
+            "SELECT COUNT(*) FROM items WHERE job_id = ?", (job_id,)
+        ).fetchone()[0]
+        skipped = len(resumes) - queued
+        print(f"Submitted job {job_id} with {queued} resumes"
+              + (f" ({skipped} blank skipped)." if skipped else "."))
+
+    elif args.command == "status":
+        status = job_status(conn, args.job_id)
+        print(f"Job {status['job_id']}: {status['done']}/{status['total']} done, "
+              f"{status['failed']} failed, {status['pending'] + status['claimed']} remaining")
+        if status["throughput_per_sec"]:
+            print(f"  Throughput: {status['throughput_per_sec']:.1f} resumes/sec")
+        if status["eta_seconds"] is not None and status["pending"] + status["claimed"]:
+            print(f"  ETA: {status['eta_seconds'] / 60:.1f} min")
+        for row in conn.execute(
+            "SELECT source_ref, error FROM items WHERE job_id = ? AND status = 'failed' "
+            "ORDER BY id LIMIT 5",
+            (args.job_id,),
+        ):
+            print(f"  Failed: {row['source_ref']}: {row['error']}")
+
+    elif args.command == "export":
+        count = export_results(conn, args.job_id, args.out)
+        print(f"Exported {count} results to {args.out}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
-import json
 import re
-from pathlib import Path
 from typing import List, Set
 
+from skill_index import SKILL_INDEX, skill_index_info
+from skill_index import SKILLS_PATH  # noqa: F401  re-exported for compatibility
+
 try:
     import spacy
     try:
@@ -20,39 +21,50 @@ except ImportError:
     SPACY_AVAILABLE = False
     nlp = None
 
-SKILLS_PATH = Path(__file__).parent / "skills.json"
-with open(SKILLS_PATH, "r", encoding="utf-8") as f:
-    SKILL_DICT = json.load(f)
+# Module-level names of the skills tables, resolved against the current index
+_LEGACY_NAMES = {
+    "SKILL_DICT": "skill_dict",
+    "ALL_SKILLS": "all_skills",
+    "MULTIWORD_SKILLS": "multiword_skills",
+}
+
 
-ALL_SKILLS = {}
-for category, skills in SKILL_DICT.items():
-    for skill in skills:
-        ALL_SKILLS[skill.lower()] = category
+def __getattr__(name):
+    if name in _LEGACY_NAMES:
+        return getattr(SKILL_INDEX.current(), _LEGACY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-MULTIWORD_SKILLS = sorted(
-    [skill for skill in ALL_SKILLS.keys() if " " in skill],
-    key=len,
-    reverse=True
-)
 
+def extract_skills(text: str, min_confidence: float = 0.5, use_spacy: bool = None) -> dict:
+    """Extract skills from resume text, grouped by category.
 
-def extract_skills(text: str, min_confidence: float = 0.5) -> dict:
+    Uses spaCy when it is available, otherwise the tech-aware tokenizer.
+    Pass ``use_spacy`` to force either mode.
+    """
+    if use_spacy is None:
+        use_spacy = SPACY_AVAILABLE and nlp is not None
+    elif use_spacy and nlp is None:
+        raise ValueError("SpaCy mode requested but 'en_core_web_sm' is not loaded")
+    
+    # Use one index snapshot for the whole call, even if a reload swaps it meanwhile
+    index = SKILL_INDEX.current()
+    all_skills, multiword_skills, tokenizer = index.all_skills, index.multiword_skills, index.tokenizer
     text_lower = text.lower()
     extracted_skills = {}
     found_skill_texts = set()
     
-    for skill in MULTIWORD_SKILLS:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            if skill not in found_skill_texts:
-                category = ALL_SKILLS[skill]
-                if category not in extracted_skills:
-                    extracted_skills[category] = []
-                extracted_skills[category].append(skill)
-                found_skill_texts.add(skill)
-    
-    if SPACY_AVAILABLE and nlp:
+    if use_spacy:
+        for skill in multiword_skills:
+            pattern = r'\b' + re.escape(skill) + r'\b'
+            matches = re.finditer(pattern, text_lower)
+            for match in matches:
+                if skill not in found_skill_texts:
+                    category = all_skills[skill]
+                    if category not in extracted_skills:
+                        extracted_skills[category] = []
+                    extracted_skills[category].append(skill)
+                    found_skill_texts.add(skill)
+        
         doc = nlp(text_lower)
         for token in doc:
             if token.is_stop or token.is_punct:
@@ -64,31 +76,32 @@ def extract_skills(text: str, min_confidence: float = 0.5) -> dict:
                 continue
             
             # Check direct match
-            if token_text in ALL_SKILLS:
-                category = ALL_SKILLS[token_text]
+            if token_text in all_skills:
+                category = all_skills[token_text]
                 if category not in extracted_skills:
                     extracted_skills[category] = []
                 if token_text not in extracted_skills[category]:
                     extracted_skills[category].append(token_text)
                     found_skill_texts.add(token_text)
         
-        for chunk in doc.noun_chunks:
+        # Pipelines without a parser (e.g. spacy.blank) have no noun chunks
+        for chunk in doc.noun_chunks if doc.has_annotation("DEP") else []:
             chunk_text = chunk.text.lower()
-            if chunk_text in ALL_SKILLS and chunk_text not in found_skill_texts:
-                category = ALL_SKILLS[chunk_text]
+            if chunk_text in all_skills and chunk_text not in found_skill_texts:
+                category = all_skills[chunk_text]
                 if category not in extracted_skills:
                     extracted_skills[category] = []
                 extracted_skills[category].append(chunk_text)
                 found_skill_texts.add(chunk_text)
     else:
-        words = re.findall(r'\b[a-z]+(?:\+\+|#)?\b', text_lower)
-        for word in words:
-            if word in ALL_SKILLS and word not in found_skill_texts:
-                category = ALL_SKILLS[word]
+        # Token n-gram candidates cover multi-word skills as well
+        for skill in tokenizer.candidates(text_lower):
+            if skill not in found_skill_texts:
+                category = all_skills[skill]
                 if category not in extracted_skills:
                     extracted_skills[category] = []
-                extracted_skills[category].append(word)
-                found_skill_texts.add(word)
+                extracted_skills[category].append(skill)
+                found_skill_texts.add(skill)
     
     for category in extracted_skills:
         extracted_skills[category] = list(set(extracted_skills[category]))
@@ -112,4 +125,4 @@ def flatten_skills(extracted_skills: dict) -> List[str]:
 
 def get_skill_categories() -> dict:
     """Return the skill dictionary."""
-    return SKILL_DICT
+    return SKILL_INDEX.current().skill_dict
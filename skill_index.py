@@ -0,0 +1,66 @@
+"""The skills.json lookup tables shared by skill extraction and skill matching.
+
+``skill_extractor`` and ``embedding_matcher`` both read their structures
+from the single ``SKILL_INDEX`` here, so one file watcher and one rebuild
+serve both, and a request always sees the extractor and matcher built from
+the same version of skills.json.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from hot_reload import ReloadableIndex
+from tech_tokenizer import TechTokenizer
+
+SKILLS_PATH = Path(__file__).parent / "skills.json"
+
+
+class SkillIndex(NamedTuple):
+    skill_dict: dict
+    all_skills: Dict[str, str]
+    multiword_skills: List[str]
+    tokenizer: TechTokenizer
+    canonical_skills: List[str]
+    vectorizer: TfidfVectorizer
+    skill_vectors: object
+
+
+def build_skill_index(path: Path) -> SkillIndex:
+    """Build the skill lookup tables and matcher vectors from a skills JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        skill_dict = json.load(f)
+
+    canonical_skills = []
+    all_skills = {}
+    for category, skills in skill_dict.items():
+        for skill in skills:
+            canonical_skills.append(skill.lower())
+            all_skills[skill.lower()] = category
+
+    multiword_skills = sorted(
+        [skill for skill in all_skills.keys() if " " in skill],
+        key=len,
+        reverse=True
+    )
+
+    vectorizer = TfidfVectorizer(
+        analyzer='char_wb',
+        ngram_range=(2, 4),
+        min_df=1,
+        lowercase=True
+    )
+    skill_vectors = vectorizer.fit_transform(canonical_skills)
+    return SkillIndex(
+        skill_dict, all_skills, multiword_skills, TechTokenizer(all_skills),
+        canonical_skills, vectorizer, skill_vectors,
+    )
+
+
+SKILL_INDEX = ReloadableIndex(SKILLS_PATH, build_skill_index)
+
+
+def skill_index_info() -> dict:
+    """Return the version id and rebuild time of the loaded skills index."""
+    return SKILL_INDEX.info()
@@ -0,0 +1,180 @@
+"""Tech-aware tokenizer used for skill extraction when spaCy is not available.
+
+The token pattern is compiled from the shapes of the skills themselves:
+characters that join word pieces inside a skill ("node.js", "ci/cd",
+"scikit-learn") become connectors and trailing symbols ("c++", "c#") become
+suffixes. Tokens are grouped into chunks separated by punctuation, which
+approximates spaCy's noun chunks well enough to look up multi-word skills
+as token n-grams.
+
+Run ``python tech_tokenizer.py`` to benchmark this mode against spaCy on
+``data/resume_dataset.csv``.
+"""
+import re
+from typing import Dict, Iterator, List
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+
+def _skill_shapes(skills: List[str]):
+    """Collect connector, prefix and suffix characters used inside skill tokens."""
+    connectors, prefixes, suffixes = set(), set(), set()
+    for skill in skills:
+        for word in skill.split():
+            core = re.search(r"[a-z0-9].*[a-z0-9]|[a-z0-9]", word)
+            if core is None:
+                continue
+            connectors.update(re.findall(r"[^a-z0-9]", core.group()))
+            if core.start() > 0:
+                prefixes.add(word[:core.start()])
+            if core.end() < len(word):
+                suffixes.add(word[core.end():])
+    return connectors, prefixes, suffixes
+
+
+class TechTokenizer:
+    """Tokenizer and skill candidate generator built from a skill lookup table.
+
+    Args:
+        all_skills: Mapping of lowercase skill name to category.
+    """
+
+    def __init__(self, all_skills: Dict[str, str]):
+        self.all_skills = all_skills
+        self.max_words = max((len(skill.split()) for skill in all_skills), default=1)
+        self.skill_words = {word for skill in all_skills for word in skill.split()}
+
+        connectors, prefixes, suffixes = _skill_shapes(list(all_skills))
+        self.connectors = "".join(sorted(connectors))
+        self.affixes = "".join(sorted(set("".join(prefixes | suffixes))))
+
+        def alternation(parts):
+            return "|".join(re.escape(p) for p in sorted(parts, key=len, reverse=True))
+
+        word = r"[a-z0-9]+"
+        pattern = word
+        if connectors:
+            pattern += rf"(?:[{re.escape(self.connectors)}]{word})*"
+        if suffixes:
+            pattern += rf"(?:{alternation(suffixes)})?"
+        if prefixes:
+            pattern = rf"(?:(?<![a-z0-9])(?:{alternation(prefixes)}))?" + pattern
+        self.token_re = re.compile(pattern)
+        self.split_re = re.compile(rf"[{re.escape(self.connectors)}]") if connectors else None
+
+    def _pieces(self, token: str) -> List[str]:
+        """Split a compound token that is not part of any skill into its word pieces.
+
+        Pieces that are skill words themselves ("c++" in "c/c++") keep their
+        affixes; only the others are stripped.
+        """
+        if token in self.skill_words or self.split_re is None:
+            return [token]
+        pieces = [
+            p if p in self.skill_words else p.strip(self.affixes)
+            for p in self.split_re.split(token)
+        ]
+        return [p for p in pieces if p]
+
+    def chunks(self, text: str) -> Iterator[List[str]]:
+        """Yield runs of tokens that are separated only by whitespace."""
+        chunk = []
+        last_end = 0
+        for match in self.token_re.finditer(text):
+            if chunk and text[last_end:match.start()].strip():
+                yield chunk
+                chunk = []
+            chunk.extend(self._pieces(match.group()))
+            last_end = match.end()
+        if chunk:
+            yield chunk
+
+    def tokenize(self, text: str) -> List[str]:
+        """Return all tokens in ``text`` (expects lowercase input)."""
+        return [token for chunk in self.chunks(text) for token in chunk]
+
+    def candidates(self, text: str) -> Iterator[str]:
+        """Yield skills found in ``text`` as single tokens or n-grams within a chunk.
+
+        Single tokens that are English stop words are skipped, as in spaCy
+        mode.
+        """
+        for chunk in self.chunks(text):
+            for i in range(len(chunk)):
+                for n in range(1, min(self.max_words, len(chunk) - i) + 1):
+                    candidate = chunk[i] if n == 1 else " ".join(chunk[i:i + n])
+                    if n == 1 and candidate in ENGLISH_STOP_WORDS:
+                        continue
+                    if candidate in self.all_skills:
+                        yield candidate
+
+
+def benchmark(limit: int = None) -> None:
+    """Compare throughput and recall of regex, tokenizer and spaCy skill extraction.
+
+    Recall is measured against the skills spaCy extraction finds in each
+    resume. Without ``en_core_web_sm`` the reference is spaCy mode run on
+    spaCy's blank English pipeline: the same tokenizer, stop words and
+    punctuation rules, but no noun chunks.
+    """
+    import time
+
+    import skill_extractor
+    from data_loader import load_csv_data
+    from skill_extractor import SKILL_INDEX, SPACY_AVAILABLE, extract_skills, flatten_skills
+    from train import DATA_PATH
+
+    texts = load_csv_data(DATA_PATH)["text"].astype(str).tolist()[:limit]
+    index = SKILL_INDEX.current()
+    all_skills, multiword_skills = index.all_skills, index.multiword_skills
+
+    def legacy(text):
+        # The extraction used before this tokenizer: multi-word regexes + \b[a-z]+\b words
+        text_lower = text.lower()
+        found = {s for s in multiword_skills if re.search(r'\b' + re.escape(s) + r'\b', text_lower)}
+        words = re.findall(r'\b[a-z]+(?:\+\+|#)?\b', text_lower)
+        return found | {w for w in words if w in all_skills}
+
+    modes = {
+        "legacy regex": legacy,
+        "tokenizer": lambda text: set(flatten_skills(extract_skills(text, use_spacy=False))),
+    }
+    reference, loaded_nlp = None, skill_extractor.nlp
+    if not SPACY_AVAILABLE:
+        try:
+            import spacy
+            skill_extractor.nlp = spacy.blank("en")
+            print("en_core_web_sm is not installed; the spaCy reference has no noun chunks.")
+        except ImportError:
+            print("spaCy is not installed; reporting throughput only.")
+    if skill_extractor.nlp is not None:
+        reference = "spacy" if SPACY_AVAILABLE else "spacy (blank)"
+        modes[reference] = lambda text: set(flatten_skills(extract_skills(text, use_spacy=True)))
+
+    found, seconds = {}, {}
+    try:
+        for name, extract in modes.items():
+            start = time.perf_counter()
+            found[name] = [extract(text) for text in texts]
+            seconds[name] = time.perf_counter() - start
+    finally:
+        skill_extractor.nlp = loaded_nlp
+
+    total = sum(len(r) for r in found[reference]) if reference else 0
+    print(f"{len(texts)} resumes" + (f", {total} skill mentions found by {reference}" if reference else ""))
+    print(f"{'mode':<14} {'docs/sec':>9} {'recall':>8}")
+    for name in modes:
+        if total:
+            hits = sum(len(f & r) for f, r in zip(found[name], found[reference]))
+            recall = f"{hits / total:>8.1%}"
+        else:
+            recall = f"{'n/a':>8}"
+        print(f"{name:<14} {len(texts) / seconds[name]:>9.1f} {recall}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the tech-aware tokenizer against spaCy.")
+    parser.add_argument("--limit", type=int, default=None, help="Only use the first N resumes")
+    benchmark(parser.parse_args().limit)
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from hot_reload import ReloadableIndex, file_version
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for background rebuild")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "index.txt"
+    path.write_text("one", encoding="utf-8")
+    return path
+
+
+def read_text(path):
+    return path.read_text(encoding="utf-8")
+
+
+def test_file_version_tracks_content(source, tmp_path):
+    version = file_version(source)
+
+    assert len(version) == 12
+    assert file_version(tmp_path / "absent.txt") == "missing"
+    source.write_text("two", encoding="utf-8")
+    assert file_version(source) != version
+
+
+def test_rebuild_runs_in_background_and_swaps(source):
+    release = threading.Event()
+    swapped = []
+
+    def builder(path):
+        text = read_text(path)
+        if text != "one":
+            release.wait(5)
+        return text
+
+    index = ReloadableIndex(source, builder, check_interval=0, on_swap=swapped.append)
+    snapshot = index.current()
+    source.write_text("second", encoding="utf-8")
+
+    # The rebuild is blocked, so readers keep getting the old index meanwhile
+    assert index.current() == "one"
+    assert index.current() == "one"
+    release.set()
+    wait_for(lambda: index.current() == "second")
+
+    assert snapshot == "one"
+    assert swapped == ["second"]
+    assert index.info()["version"] == file_version(source)
+
+
+def test_failed_rebuild_keeps_previous_index(source):
+    def builder(path):
+        text = read_text(path)
+        if text == "broken":
+            raise ValueError("bad index")
+        return text
+
+    index = ReloadableIndex(source, builder, check_interval=0)
+    version = index.version
+    source.write_text("broken", encoding="utf-8")
+    index.current()
+    wait_for(lambda: index.info()["last_error"] is not None)
+
+    assert index.current() == "one"
+    assert index.info()["last_error"] == "ValueError: bad index"
+    assert index.version == version
+
+    source.write_text("fixed!", encoding="utf-8")
+    wait_for(lambda: index.current() == "fixed!")
+    assert index.info()["last_error"] is None
+
+
+def test_changes_are_not_checked_within_interval(source):
+    index = ReloadableIndex(source, read_text, check_interval=60)
+    source.write_text("second", encoding="utf-8")
+
+    assert index.current() == "one"
+
+
+def test_reload_rebuilds_synchronously(source):
+    builds = []
+
+    def builder(path):
+        builds.append(1)
+        return read_text(path)
+
+    index = ReloadableIndex(source, builder, check_interval=60)
+    source.write_text("second", encoding="utf-8")
+    index.reload()
+
+    assert index.current() == "second"
+    assert len(builds) == 2
+    info = index.info()
+    assert info["path"] == str(source)
+    assert info["version"] == file_version(source)
+    assert info["rebuild_seconds"] >= 0
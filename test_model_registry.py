@@ -0,0 +1,75 @@
+import time
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+
+import model_registry
+from model_registry import ModelRegistry
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for background reload")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    model = make_pipeline(TfidfVectorizer(), LogisticRegression())
+    model.fit(
+        ["python machine learning pandas", "java spring microservices", "sales quota clients"],
+        ["Data Science", "Java Developer", "Sales"],
+    )
+    path = tmp_path / "model.joblib"
+    joblib.dump(model, path)
+    return path
+
+
+def test_model_is_loaded_once_for_repeated_predictions(model_path, monkeypatch):
+    loads = []
+    load = joblib.load
+    monkeypatch.setattr(model_registry.joblib, "load", lambda path: loads.append(path) or load(path))
+
+    registry = ModelRegistry(model_path)
+    for _ in range(5):
+        registry.predict("python machine learning")
+
+    assert len(loads) == 1
+    assert registry.get_model() is registry.get_model()
+
+
+def test_predict_matches_the_model(model_path):
+    registry = ModelRegistry(model_path)
+    model = joblib.load(model_path)
+
+    for text in ["python pandas", "java spring", "clients and quota"]:
+        label, probabilities = registry.predict(text)
+        assert label == model.predict([text])[0]
+        np.testing.assert_allclose(probabilities, model.predict_proba([text])[0])
+
+
+def test_invalid_replacement_keeps_serving_previous_model(model_path):
+    registry = ModelRegistry(model_path, check_interval=0)
+    model = registry.get_model()
+    version = registry.info()["version"]
+
+    joblib.dump({"not": "a classifier"}, model_path)
+    registry.get_model()
+    wait_for(lambda: registry.info()["last_error"] is not None)
+
+    info = registry.info()
+    assert info["last_error"].startswith("ValueError: model.joblib is not a fitted")
+    assert info["version"] == version
+    assert registry.get_model() is model
+    assert registry.predict("java spring")[0] == "Java Developer"
+
+
+def test_missing_model_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ModelRegistry(tmp_path / "missing.joblib")
@@ -0,0 +1,109 @@
+import pytest
+
+import result_cache
+from result_cache import ResultCache
+
+
+@pytest.fixture
+def artifacts(monkeypatch):
+    """Stand in for the model, skills and role database versions in service."""
+    versions = {"model": "m1", "skills": "s1", "roles": "r1"}
+    monkeypatch.setattr(result_cache, "artifact_versions", lambda: dict(versions))
+    return versions
+
+
+@pytest.fixture
+def cache(tmp_path, artifacts):
+    cache = ResultCache(tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+def test_miss_then_hit(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"prediction": "Data Science"}
+
+    first = cache.get_or_compute("Python developer", {"top": 3}, compute)
+    second = cache.get_or_compute("Python developer", {"top": 3}, compute)
+
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["prediction"] == "Data Science"
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_options_are_part_of_the_key(cache):
+    cache.put("Python developer", {"top": 3}, {"prediction": "a"})
+
+    assert cache.get("Python developer", {"top": 5}) is None
+
+
+def test_formatting_differences_share_an_entry(cache):
+    cache.put("Python developer", {}, {"prediction": "a"})
+
+    assert cache.get("  PYTHON   Developer\n", {}) == {"prediction": "a"}
+
+
+def test_evicts_least_recently_used_entries(tmp_path, artifacts):
+    cache = ResultCache(tmp_path / "cache.db", max_bytes=120)
+    for i in range(3):
+        cache.put(f"resume {i}", {}, {"prediction": "x" * 20})
+    cache.get("resume 0", {})
+    cache.put("resume 3", {}, {"prediction": "x" * 20})
+
+    assert cache.get("resume 0", {}) is not None
+    assert cache.get("resume 1", {}) is None
+    assert cache.stats()["bytes"] <= 120
+    cache.close()
+
+
+def test_artifact_change_invalidates_entries(tmp_path, artifacts, cache):
+    cache.put("Python developer", {}, {"prediction": "a"})
+
+    artifacts["skills"] = "s2"
+    cache.refresh_artifacts()
+
+    assert cache.get("Python developer", {}) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lifetime_stats_survive_reopening(tmp_path, artifacts):
+    cache = ResultCache(tmp_path / "cache.db")
+    cache.get_or_compute("Python developer", {}, lambda: {"prediction": "a"})
+    cache.close()
+
+    cache = ResultCache(tmp_path / "cache.db")
+    cache.get("Python developer", {})
+    stats = cache.stats()
+    summary = cache.summary(hits=3, misses=1)
+    cache.close()
+
+    assert (stats["hits"], stats["misses"]) == (1, 0)
+    assert (stats["lifetime_hits"], stats["lifetime_misses"]) == (1, 1)
+    assert summary.startswith("Cache: 3/4 hits; lifetime hit rate 50.0%")
+
+
+def test_versions_come_from_the_indexes_in_service(monkeypatch):
+    import model_registry
+    import predict_cli
+    from skill_index import SKILL_INDEX
+
+    class Registry:
+        def info(self):
+            return {"version": "loaded-model"}
+
+    monkeypatch.setattr(model_registry, "get_registry", lambda: Registry())
+    monkeypatch.setattr(predict_cli, "role_index_info", lambda: {"version": "loaded-roles"})
+    monkeypatch.setattr(SKILL_INDEX, "version", "loaded-skills")
+
+    assert result_cache.artifact_versions() == {
+        "model": "loaded-model", "skills": "loaded-skills", "roles": "loaded-roles",
+    }
+
+
+def test_screening_options_ignore_budget_outside_fast_mode():
+    assert result_cache.screening_options(3, False, 50) == result_cache.screening_options(3)
+    assert result_cache.screening_options(3, True, 50) != result_cache.screening_options(3, True)
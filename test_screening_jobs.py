@@ -0,0 +1,137 @@
+import csv
+import json
+
+import pytest
+
+import predict_cli
+import result_cache
+import screening_jobs as jobs
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = jobs.connect(tmp_path / "jobs.db")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def stub_screening(monkeypatch):
+    """Replace the model and screening logic with a cheap deterministic stand-in."""
+    def screen_resume(text, model, role_db=None, top=3, **kwargs):
+        if "crash" in text:
+            raise RuntimeError("bad resume")
+        return {"prediction": text.split()[0], "top_matches": [("Role", 3)], "decided_by": "keywords"}
+
+    monkeypatch.setattr(predict_cli, "screen_resume", screen_resume)
+    monkeypatch.setattr(predict_cli, "load_model", lambda: None)
+    monkeypatch.setattr(predict_cli, "load_role_database", lambda: None)
+    monkeypatch.setattr(result_cache, "artifact_versions", lambda: {"model": "stub"})
+
+
+def submit(conn, texts):
+    return jobs.submit_job(conn, [(f"r{i}", text) for i, text in enumerate(texts)], "test")
+
+
+def test_read_resumes_accepts_unlabeled_csv_and_skips_empty_cells(tmp_path):
+    path = tmp_path / "applicants.csv"
+    path.write_text('Name,Resume\nAda,"Python developer"\nBob,\n', encoding="utf-8")
+
+    assert jobs.read_resumes(path) == [("applicants.csv:0", "Python developer")]
+
+
+def test_submit_skips_blank_resumes(conn):
+    job_id = submit(conn, ["python dev", "   ", "java dev"])
+
+    assert jobs.job_status(conn, job_id)["total"] == 2
+
+
+def test_claim_and_commit_batches(conn):
+    job_id = submit(conn, ["a", "b", "c"])
+
+    first = jobs.claim_batch(conn, job_id, "w1", 2)
+    second = jobs.claim_batch(conn, job_id, "w2", 2)
+    assert [row["text"] for row in first] == ["a", "b"]
+    assert [row["text"] for row in second] == ["c"]
+    assert jobs.claim_batch(conn, job_id, "w3", 2) == []
+
+    jobs.commit_results(conn, [(first[0]["id"], "{}", None), (first[1]["id"], None, "Err: x")])
+    status = jobs.job_status(conn, job_id)
+    assert (status["done"], status["failed"], status["claimed"]) == (1, 1, 1)
+
+
+def test_release_only_requeues_claims_of_dead_runs(conn, monkeypatch):
+    job_id = submit(conn, ["a", "b", "c", "d"])
+    monkeypatch.setattr(jobs, "_pid_alive", lambda pid: pid == 111)
+
+    alive_run = jobs.start_run(conn, job_id, pid=111)
+    dead_run = jobs.start_run(conn, job_id, pid=222)
+    jobs.claim_batch(conn, job_id, "pid-111", 2, alive_run)
+    jobs.claim_batch(conn, job_id, "pid-222", 2, dead_run)
+
+    # A new run closes out the dead one and only takes back its claims
+    jobs.start_run(conn, job_id, pid=333)
+    assert jobs.release_stale_claims(conn, job_id) == 2
+    status = jobs.job_status(conn, job_id)
+    assert (status["pending"], status["claimed"]) == (2, 2)
+
+
+def test_release_keeps_claims_of_orphaned_live_workers(conn, monkeypatch):
+    job_id = submit(conn, ["a", "b"])
+    monkeypatch.setattr(jobs, "_pid_alive", lambda pid: pid == 111)
+
+    # The run's parent (pid 222) died, but its worker process 111 is still screening
+    run_id = jobs.start_run(conn, job_id, pid=222)
+    jobs.claim_batch(conn, job_id, "pid-111", 2, run_id)
+
+    jobs.start_run(conn, job_id, pid=333)
+    assert jobs.release_stale_claims(conn, job_id) == 0
+
+
+def test_throughput_ignores_time_before_resumed_run(conn):
+    job_id = submit(conn, ["a", "b", "c", "d"])
+    old_run = jobs.start_run(conn, job_id)
+    rows = jobs.claim_batch(conn, job_id, "w", 2, old_run)
+    jobs.commit_results(conn, [(row["id"], "{}", None) for row in rows])
+    conn.execute("UPDATE items SET finished_at = 0 WHERE run_id = ?", (old_run,))
+    jobs.finish_run(conn, old_run)
+
+    run_id = jobs.start_run(conn, job_id)
+    conn.execute("UPDATE runs SET started_at = 1000 WHERE id = ?", (run_id,))
+    rows = jobs.claim_batch(conn, job_id, "w", 1, run_id)
+    jobs.commit_results(conn, [(rows[0]["id"], "{}", None)])
+
+    status = jobs.job_status(conn, job_id, now=1010)
+    assert status["throughput_per_sec"] == pytest.approx(0.1)
+    assert status["eta_seconds"] == pytest.approx(10)
+
+
+def test_worker_screens_job_and_export_writes_results(tmp_path, conn, stub_screening):
+    job_id = submit(conn, ["python dev", "crash me", "java dev"])
+    run_id = jobs.start_run(conn, job_id)
+
+    jobs._worker(str(tmp_path / "jobs.db"), job_id, run_id, batch_size=2)
+
+    status = jobs.job_status(conn, job_id)
+    assert (status["done"], status["failed"], status["pending"]) == (2, 1, 0)
+
+    out = tmp_path / "results.csv"
+    assert jobs.export_results(conn, job_id, out) == 3
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["prediction"] for row in rows] == ["python", "", "java"]
+    assert rows[0]["top_matches"] == "Role (3)"
+    assert rows[1]["error"] == "RuntimeError: bad resume"
+    result = json.loads(conn.execute("SELECT result FROM items WHERE id = 1").fetchone()[0])
+    assert result["decided_by"] == "keywords"
+
+
+def test_worker_records_cache_hits_on_its_run(tmp_path, conn, stub_screening):
+    job_id = submit(conn, ["python dev", "Python  dev", "java dev"])
+    run_id = jobs.start_run(conn, job_id)
+
+    jobs._worker(str(tmp_path / "jobs.db"), job_id, run_id, batch_size=2,
+                 cache_path=str(tmp_path / "cache.db"))
+
+    run = conn.execute("SELECT cache_hits, cache_misses FROM runs WHERE id = ?", (run_id,)).fetchone()
+    assert (run["cache_hits"], run["cache_misses"]) == (1, 2)
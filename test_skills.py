@@ -1,4 +1,4 @@
-from skill_extractor import extract_skills
+from skill_extractor import extract_skills, flatten_skills
 from embedding_matcher import match_skill_to_canonical, enrich_skills
 
 test_resume = """
@@ -55,6 +55,22 @@ print("\nTop 10 skills with confidence:")
 for skill in top:
     print(f"  • {skill['canonical']} ({skill['category']}) - {skill['confidence']:.2f}")
 
+print("\n" + "=" * 60)
+print("4. Testing tech-aware tokenizer (regex mode):")
+print("=" * 60)
+
+tech_resume = "Built services with Node.js, Next.js and C++; set up CI/CD for ASP.NET apps (C#)."
+tech_skills = flatten_skills(extract_skills(tech_resume, use_spacy=False))
+print(f"\n  Found: {', '.join(sorted(tech_skills))}")
+for expected in ["node.js", "next.js", "c++", "ci/cd", "asp.net", "c#"]:
+    assert expected in tech_skills, f"missing {expected}"
+
+for listed, expected in [("Languages: C/C++", ["c++"]), ("Python/C# developer", ["python", "c#"])]:
+    found = flatten_skills(extract_skills(listed, use_spacy=False))
+    print(f"  {listed!r} → {', '.join(sorted(found))}")
+    for skill in expected:
+        assert skill in found, f"missing {skill} in {listed!r}"
+
 print("\n" + "=" * 60)
 print("✅ All tests completed successfully!")
 print("=" * 60)
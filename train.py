@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import joblib
@@ -8,6 +9,8 @@ from sklearn.metrics import accuracy_score, classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 
+from corpus_store import corpus_available, load_corpus
+from model_registry import get_registry
 from preprocessing import clean_resume
 
 
@@ -19,6 +22,11 @@ MODEL_PATH = MODEL_DIR / "resume_classifier.joblib"
 
 
 def load_data() -> pd.DataFrame:
+    if corpus_available(source=DATA_PATH):
+        # Columnar corpus: read only what training needs, already cleaned
+        df = load_corpus(["cleaned_text", "category"])
+        return df.rename(columns={"cleaned_text": "cleaned_resume", "category": "Category"})
+
     df = pd.read_csv(DATA_PATH, encoding="utf-8")
     if "Resume" not in df.columns or "Category" not in df.columns:
         raise ValueError("CSV must contain 'Resume' and 'Category' columns")
@@ -44,8 +52,8 @@ def build_model() -> Pipeline:
 
 def train() -> None:
     df = load_data()
-    X = df["cleaned_resume"].values
-    y = df["Category"].values
+    X = df["cleaned_resume"].to_numpy()
+    y = df["Category"].to_numpy()
 
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=0, stratify=y
@@ -58,16 +66,15 @@ def train() -> None:
     print("Accuracy:", accuracy_score(y_test, y_pred))
     print(classification_report(y_test, y_pred))
 
-    joblib.dump(model, MODEL_PATH)
+    # Write to a temporary file and rename, so running processes never load a partial model
+    tmp_path = MODEL_PATH.with_suffix(".joblib.tmp")
+    joblib.dump(model, tmp_path)
+    os.replace(tmp_path, MODEL_PATH)
     print(f"Saved model to {MODEL_PATH}")
 
 
 def predict_resume(text: str):
-    model = joblib.load(MODEL_PATH)
-    cleaned = clean_resume(text)
-    prediction = model.predict([cleaned])
-    probabilities = model.predict_proba([cleaned])
-    return prediction[0], probabilities[0]
+    return get_registry().predict(clean_resume(text))
 
 
 if __name__ == "__main__":